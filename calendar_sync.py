@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 import os
-import time
 import argparse
 import logging
 import pickle
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 import icalendar
 import requests
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 # Get the script directory for relative paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,15 +22,72 @@ LOG_FILE = os.path.join(SCRIPT_DIR, "calendar_sync.log")
 logging.basicConfig(
     level=logging.INFO, 
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+    handlers=[logging.FileHandler(LOG_FILE, delay=True), logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
 
 # Google Calendar API scopes
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Summary prefixes Outlook/Exchange use to mark cancelled events in iCal exports
+CANCELLED_PREFIXES = ('Canceled:', 'Cancelled:')
+
+# Day names indexed by datetime.weekday()
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Partial-response masks for Google API reads. Only the attributes the sync
+# actually reads are requested, which keeps the JSON payloads small.
+# nextPageToken is included so paged results can still be followed.
+CALENDAR_LIST_FIELDS = 'items(id,summary),nextPageToken'
+MASTER_EVENT_FIELDS = 'items(id,summary,iCalUID,recurrence,extendedProperties),nextPageToken'
+INSTANCE_FIELDS = 'items(id,status,recurringEventId,originalStartTime),nextPageToken'
+
+# Requests sent per Google API batch call (Google recommends at most 50)
+BATCH_SIZE = 50
+
+# Times a batched request failing with a rate-limit or server error is resent
+MAX_BATCH_RETRIES = 5
+
+# 403 reasons Google returns when a request was rejected for exceeding a rate limit
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+# Events returned per page by events.list/instances (the API maximum; the default is 250)
+EVENTS_PAGE_SIZE = 2500
+
+# How far before the last pass started the change check looks, so Google edits
+# aren't missed when this host's clock runs ahead of Google's
+CHANGE_CHECK_MARGIN = timedelta(minutes=2)
+
+# Longest an incremental sync may be skipped for. Events move into the sliding
+# sync window without either calendar changing, and only a full pass picks them up
+FULL_SYNC_INTERVAL = timedelta(hours=1)
+
+# OAuth client secrets downloaded from Google Cloud Console
+KEY_FILE = os.path.join(SCRIPT_DIR, 'google_calendar_key.json')
+
+def _original_start(instance):
+    """Return the dateTime (or all-day date) a recurring event instance was originally scheduled for."""
+    original_start = instance.get('originalStartTime')
+    if not original_start:
+        return None
+    return original_start.get('dateTime') or original_start.get('date')
+
+def _is_retryable(exception):
+    """Return True for Google API errors that are worth retrying: rate limits and server errors."""
+    if not isinstance(exception, HttpError):
+        return False
+    status = exception.resp.status
+    if status == 429 or status >= 500:
+        return True
+    if status != 403:
+        return False
+    content = exception.content
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    return any(reason in content for reason in RATE_LIMIT_REASONS)
+
 class CalendarSync:
-    def __init__(self, ical_url, calendar_name, days_back=30, days_forward=60, sync_interval=5):
+    def __init__(self, ical_url, calendar_name, days_back=30, days_forward=60, sync_interval=5, http_session=None):
         """
         Initialize the calendar sync object.
         
@@ -37,13 +97,30 @@ class CalendarSync:
             days_back (int): Number of days in the past to sync initially
             days_forward (int): Number of days in the future to sync initially
             sync_interval (int): Minutes between sync operations
+            http_session (requests.Session): Session used to fetch the iCal URL.
+                A new session is created if not provided.
         """
         self.ical_url = ical_url
         self.calendar_name = calendar_name
         self.days_back = days_back
         self.days_forward = days_forward
         self.sync_interval = sync_interval
+        self.http_session = http_session or requests.Session()
+        # Validators and parsed copy of the last iCal response, used for conditional fetches
+        self._ical_etag = None
+        self._ical_last_modified = None
+        self._ical_calendar = None
+        # Whether the last fetch was answered with 304 Not Modified
+        self._ical_unchanged = False
+        # When the last sync pass without failed writes started, used to skip passes with nothing to do
+        self._last_synced_at = None
+        # Writes made by the current pass (event ID -> its 'updated' stamp, None for deletes)
+        # and the number of writes that failed; see _begin_pass()
+        self._pass_writes = {}
+        self._pass_write_failures = 0
         self.service = self._authenticate_google()
+        # Resource objects are rebuilt on every service.events() call, so bind it once
+        self.events_api = self.service.events()
         self.target_calendar_id = self._get_or_create_calendar()
         self.synced_events = {}  # Dictionary to track synced events by UID
         
@@ -53,7 +130,6 @@ class CalendarSync:
         # Use a filename safe version of the calendar name for the token file
         safe_name = self.calendar_name.replace(" ", "_").replace("/", "_").replace("\\", "_")
         token_path = os.path.join(SCRIPT_DIR, f'token_{safe_name}.pickle')
-        key_path = os.path.join(SCRIPT_DIR, 'google_calendar_key.json')
         
         # Try to load existing token
         if os.path.exists(token_path):
@@ -65,34 +141,34 @@ class CalendarSync:
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(Request())
             else:
-                if not os.path.exists(key_path):
+                if not os.path.exists(KEY_FILE):
                     raise FileNotFoundError(
-                        f"Google Calendar API key not found at {key_path}. "
+                        f"Google Calendar API key not found at {KEY_FILE}. "
                         "Please download it from Google Cloud Console and rename it to google_calendar_key.json"
                     )
                 
-                flow = InstalledAppFlow.from_client_secrets_file(key_path, SCOPES)
+                flow = InstalledAppFlow.from_client_secrets_file(KEY_FILE, SCOPES)
                 creds = flow.run_local_server(port=0)
                 
             # Save the token
             with open(token_path, 'wb') as token:
                 pickle.dump(creds, token)
                 
-        return build('calendar', 'v3', credentials=creds)
+        # The discovery document ships with google-api-python-client, so skip
+        # probing for the legacy discovery cache on every build
+        return build('calendar', 'v3', credentials=creds, cache_discovery=False)
     
     def _get_or_create_calendar(self):
         """Get existing calendar or create a new one with the specified name."""
-        # List existing calendars
-        calendar_list = self.service.calendarList().list().execute()
-        
-        # Check if our calendar already exists
-        for calendar in calendar_list.get('items', []):
+        # Check if our calendar already exists, stopping at the first page that has it
+        calendars = self._iter_items(self.service.calendarList(), 'list', fields=CALENDAR_LIST_FIELDS)
+        for calendar in calendars:
             if calendar.get('summary') == self.calendar_name:
-                logger.info(f"Found existing calendar: {self.calendar_name}")
+                logger.info("Found existing calendar: %s", self.calendar_name)
                 return calendar['id']
         
         # If not found, create a new calendar
-        logger.info(f"Creating new calendar: {self.calendar_name}")
+        logger.info("Creating new calendar: %s", self.calendar_name)
         calendar = {
             'summary': self.calendar_name,
             'timeZone': 'UTC'
@@ -100,21 +176,106 @@ class CalendarSync:
         created_calendar = self.service.calendars().insert(body=calendar).execute()
         return created_calendar['id']
     
+    def _iter_items(self, collection, method_name, **kwargs):
+        """
+        Execute a paged Google API request, yielding items one page at a time.
+        
+        The next page is only requested once the current one has been consumed,
+        so callers that stop iterating early skip the remaining pages.
+        
+        Args:
+            collection: API collection to call, e.g. self.events_api
+            method_name (str): Paged method of the collection, e.g. 'list' or 'instances'
+            **kwargs: Parameters for the request
+        
+        Yields:
+            dict: Items from each page in turn
+        """
+        next_page = getattr(collection, method_name + '_next')
+        request = getattr(collection, method_name)(**kwargs)
+        while request is not None:
+            response = request.execute()
+            yield from response.get('items', [])
+            request = next_page(request, response)
+    
+    def _execute_batch(self, batch_requests, callback):
+        """
+        Execute Google API requests in batches of BATCH_SIZE, one HTTP round trip per batch.
+        
+        Args:
+            batch_requests (list): (request_id, request) pairs; request IDs must be unique
+            callback (callable): Called as callback(request_id, response, exception) for each request
+        
+        Requests that fail with a rate-limit or server error are resent in a
+        follow-up batch with exponential backoff, up to MAX_BATCH_RETRIES times.
+        callback only sees each request's final outcome.
+        """
+        for start in range(0, len(batch_requests), BATCH_SIZE):
+            pending = batch_requests[start:start + BATCH_SIZE]
+            attempt = 0
+            while pending:
+                requests_by_id = dict(pending)
+                retry = []
+                
+                def check_response(request_id, response, exception):
+                    if exception is not None and attempt < MAX_BATCH_RETRIES and _is_retryable(exception):
+                        retry.append((request_id, requests_by_id[request_id]))
+                    else:
+                        callback(request_id, response, exception)
+                
+                batch = self.service.new_batch_http_request(callback=check_response)
+                for request_id, request in pending:
+                    batch.add(request, request_id=request_id)
+                batch.execute()
+                
+                if retry:
+                    delay = 2 ** attempt
+                    logger.warning("Retrying %s batched requests in %s seconds after rate-limit or server errors",
+                                   len(retry), delay)
+                    time.sleep(delay)
+                    attempt += 1
+                pending = retry
+    
     def fetch_ical_events(self):
-        """Fetch events from the iCal URL."""
+        """
+        Fetch events from the iCal URL.
+        
+        The ETag/Last-Modified validators of the previous response are sent back
+        so the server can answer 304 Not Modified, in which case the previously
+        parsed calendar is reused instead of downloading and parsing it again.
+        """
+        headers = {}
+        if self._ical_calendar is not None:
+            if self._ical_etag:
+                headers['If-None-Match'] = self._ical_etag
+            if self._ical_last_modified:
+                headers['If-Modified-Since'] = self._ical_last_modified
+        
         try:
-            response = requests.get(self.ical_url)
+            response = self.http_session.get(self.ical_url, headers=headers)
+            if response.status_code == 304:
+                logger.info("Calendar data unchanged at %s, reusing previous copy", self.ical_url)
+                self._ical_unchanged = True
+                return self._ical_calendar
             response.raise_for_status()  # Raise an exception for HTTP errors
+            self._ical_unchanged = False
             
             calendar = icalendar.Calendar.from_ical(response.text)
-            logger.info(f"Successfully fetched calendar data from {self.ical_url}")
+            self._ical_etag = response.headers.get('ETag')
+            self._ical_last_modified = response.headers.get('Last-Modified')
+            self._ical_calendar = calendar
+            logger.info("Successfully fetched calendar data from %s", self.ical_url)
             return calendar
         except Exception as e:
-            logger.error(f"Error fetching iCal data: {e}")
+            logger.error("Error fetching iCal data: %s", e)
             return None
     
-    def _convert_ical_to_google_event(self, event):
-        """Convert an iCal event to Google Calendar format."""
+    def _convert_ical_to_google_event(self, event, synced_at=None):
+        """
+        Convert an iCal event to Google Calendar format.
+        
+        synced_at is the timestamp written into the description; it defaults to now.
+        """
         start_dt = event.get('DTSTART').dt
         
         # Handle datetime vs date events differently
@@ -122,7 +283,7 @@ class CalendarSync:
             # Check if timezone info is present
             if start_dt.tzinfo is None:
                 # No timezone, use UTC
-                logger.warning(f"Event {event.get('SUMMARY')} has no timezone. Using UTC.")
+                logger.warning("Event %s has no timezone. Using UTC.", event.get('SUMMARY'))
                 start = {
                     'dateTime': start_dt.strftime('%Y-%m-%dT%H:%M:%S'),
                     'timeZone': 'UTC'
@@ -161,7 +322,9 @@ class CalendarSync:
         description = event.get('DESCRIPTION', '')
         if description:
             description += '\n\n'
-        description += f"Synced from external calendar on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        if synced_at is None:
+            synced_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        description += f"Synced from external calendar on {synced_at}"
         
         # Check for event status - default is confirmed
         event_status = 'confirmed'  
@@ -173,9 +336,9 @@ class CalendarSync:
         # 1. First check summary for "Canceled:" or "Cancelled:" prefix
         # This is how Outlook/Exchange represents cancelled events in the iCal export
         event_summary = str(event.get('SUMMARY', ''))
-        if event_summary.startswith('Canceled:') or event_summary.startswith('Cancelled:'):
+        if event_summary.startswith(CANCELLED_PREFIXES):
             event_status = 'cancelled'
-            logger.info(f"Found cancelled event in source calendar (from summary prefix): {event_summary}")
+            logger.info("Found cancelled event in source calendar (from summary prefix): %s", event_summary)
         
         # 2. Check for STATUS property in the iCal event
         # STATUS property in iCal can be: TENTATIVE, CONFIRMED, or CANCELLED
@@ -184,10 +347,10 @@ class CalendarSync:
             ical_status_str = str(ical_status).upper()
             if ical_status_str == 'CANCELLED':
                 event_status = 'cancelled'
-                logger.info(f"Found cancelled event in source calendar (from STATUS): {event.get('SUMMARY')}")
+                logger.info("Found cancelled event in source calendar (from STATUS): %s", event.get('SUMMARY'))
             elif ical_status_str == 'TENTATIVE':
                 event_status = 'tentative'
-                logger.info(f"Found tentative event in source calendar: {event.get('SUMMARY')}")
+                logger.info("Found tentative event in source calendar: %s", event.get('SUMMARY'))
         
         # 3. Check for PARTSTAT (participation status) for attendees
         # This indicates if a specific attendee has declined the event
@@ -200,7 +363,7 @@ class CalendarSync:
                 att_str = str(att)
                 if 'PARTSTAT=DECLINED' in att_str.upper():
                     event_status = 'cancelled'
-                    logger.info(f"Event declined by an attendee in source calendar: {event.get('SUMMARY')}")
+                    logger.info("Event declined by an attendee in source calendar: %s", event.get('SUMMARY'))
                     break
         
         # Initialize extended_properties for any event type
@@ -217,8 +380,8 @@ class CalendarSync:
         rrule = event.get('RRULE')
         recurrence = None
         if rrule:
-            logger.info(f"Found recurring event with summary: {event.get('SUMMARY')} and UID: {event.get('UID')}")
-            logger.info(f"Recurrence rule: {rrule}")
+            logger.info("Found recurring event with summary: %s and UID: %s", event.get('SUMMARY'), event.get('UID'))
+            logger.info("Recurrence rule: %s", rrule)
             
             # Mark this as a recurring event in extended properties
             extended_properties['private']['isRecurring'] = 'true'
@@ -229,15 +392,15 @@ class CalendarSync:
             interval = rrule.get('INTERVAL', [1])[0]
             until = rrule.get('UNTIL', [None])[0]
             
-            logger.info(f"Detailed recurrence: FREQ={freq}, BYDAY={byday}, INTERVAL={interval}, UNTIL={until}")
+            logger.info("Detailed recurrence: FREQ=%s, BYDAY=%s, INTERVAL=%s, UNTIL=%s", freq, byday, interval, until)
             
             # Convert the iCal RRULE to Google Calendar recurrence format
             try:
                 rrule_str = rrule.to_ical().decode('utf-8')
-                logger.info(f"Raw RRULE string: {rrule_str}")
+                logger.info("Raw RRULE string: %s", rrule_str)
                 recurrence = [f"RRULE:{rrule_str}"]
             except Exception as e:
-                logger.error(f"Error converting recurrence rule: {e}")
+                logger.error("Error converting recurrence rule: %s", e)
                 # Manually construct the recurrence rule
                 rrule_parts = []
                 if freq:
@@ -250,14 +413,14 @@ class CalendarSync:
                     rrule_parts.append(f"UNTIL={until.strftime('%Y%m%dT%H%M%SZ')}")
                 
                 manual_rrule = ";".join(rrule_parts)
-                logger.info(f"Manually constructed RRULE: {manual_rrule}")
+                logger.info("Manually constructed RRULE: %s", manual_rrule)
                 recurrence = [f"RRULE:{manual_rrule}"]
                 
             # Check for RECURRENCE-ID which indicates an exception to a recurring event
             recurrence_id = event.get('RECURRENCE-ID')
             
             if recurrence_id:
-                logger.info(f"Found exception to recurring event: {event.get('SUMMARY')} on {recurrence_id.dt}")
+                logger.info("Found exception to recurring event: %s on %s", event.get('SUMMARY'), recurrence_id.dt)
                 
                 # This is a special case - need to handle as an exception
                 # Mark in extended properties that this is a recurring event exception
@@ -268,7 +431,7 @@ class CalendarSync:
                 else:
                     exception_date_str = str(exception_date)
                     
-                logger.info(f"Exception date: {exception_date_str}")
+                logger.info("Exception date: %s", exception_date_str)
                 
                 # Add recurrence exception info to extended_properties
                 extended_properties['private']['recurrenceException'] = 'true'
@@ -276,7 +439,7 @@ class CalendarSync:
                 
                 # If this exception is cancelled, it means this specific instance was declined
                 if event_status == 'cancelled':
-                    logger.info(f"This recurring event exception is cancelled: {event.get('SUMMARY')} on {exception_date_str}")
+                    logger.info("This recurring event exception is cancelled: %s on %s", event.get('SUMMARY'), exception_date_str)
             
         # Convert to Google Calendar event format
         google_event = {
@@ -296,46 +459,114 @@ class CalendarSync:
             
         # Log if we found a cancelled event
         if event_status == 'cancelled':
-            logger.info(f"Converting event with cancelled status: {google_event.get('summary')}")
+            logger.info("Converting event with cancelled status: %s", google_event.get('summary'))
         
         return google_event
     
+    def _sync_window(self):
+        """Return the (timeMin, timeMax) bounds of the sync window as RFC 3339 strings."""
+        now = datetime.now(timezone.utc)
+        time_min = (now - timedelta(days=self.days_back)).isoformat()
+        time_max = (now + timedelta(days=self.days_forward)).isoformat()
+        return time_min, time_max
+    
+    def _begin_pass(self):
+        """Reset the per-pass write tracking and return the time the pass started."""
+        # Until this pass finishes cleanly the next one must not be skipped
+        self._last_synced_at = None
+        self._pass_writes = {}
+        self._pass_write_failures = 0
+        return datetime.now(timezone.utc)
+    
+    def _finish_pass(self, pass_started):
+        """
+        Remember a completed pass so later passes can be skipped when nothing changes.
+        
+        A pass with failed writes is not remembered, so the next pass runs in full
+        and retries them even if neither calendar changes in the meantime.
+        """
+        if self._pass_write_failures:
+            logger.warning("%s writes failed; the next sync will run in full to retry them", self._pass_write_failures)
+            self._last_synced_at = None
+        else:
+            self._last_synced_at = pass_started
+    
+    def _record_write(self, event):
+        """Note an event written by the current pass so the change check can tell it apart from edits by others."""
+        self._pass_writes[event['id']] = event.get('updated')
+    
+    def _google_changed_since_last_sync(self):
+        """Check whether anyone else modified an event in the target calendar since the last sync pass started."""
+        if self._last_synced_at is None:
+            return True
+        if datetime.now(timezone.utc) - self._last_synced_at >= FULL_SYNC_INTERVAL:
+            # The sync window has moved on since then; run in full to catch up with it
+            return True
+        
+        try:
+            # updatedMin also returns events deleted since then. Our own writes from the last
+            # pass show up here too, so only an event we did not leave in that state counts
+            changed_events = self._iter_items(
+                self.events_api, 'list',
+                calendarId=self.target_calendar_id,
+                updatedMin=(self._last_synced_at - CHANGE_CHECK_MARGIN).isoformat(),
+                showDeleted=True,
+                maxResults=EVENTS_PAGE_SIZE,
+                fields='items(id,status,updated),nextPageToken'
+            )
+            for event in changed_events:
+                if event['id'] not in self._pass_writes:
+                    return True
+                written = self._pass_writes[event['id']]
+                if written is None:
+                    if event.get('status') != 'cancelled':
+                        return True
+                elif written != event.get('updated'):
+                    return True
+        except Exception as e:
+            logger.warning("Could not check Google Calendar for changes: %s", e)
+            return True
+        return False
+    
     def _get_google_events(self):
         """Get all events from the target Google Calendar."""
-        time_min = (datetime.utcnow() - timedelta(days=self.days_back)).isoformat() + 'Z'
-        time_max = (datetime.utcnow() + timedelta(days=self.days_forward)).isoformat() + 'Z'
+        time_min, time_max = self._sync_window()
         
         # First get all master events (including recurring)
-        master_events_result = self.service.events().list(
+        master_events = self._iter_items(
+            self.events_api, 'list',
             calendarId=self.target_calendar_id,
             timeMin=time_min,
             timeMax=time_max,
             singleEvents=False,  # Get master events for recurring events
-            orderBy='updated'
-        ).execute()
+            orderBy='updated',
+            maxResults=EVENTS_PAGE_SIZE,
+            fields=MASTER_EVENT_FIELDS
+        )
         
         # Then get expanded instances to identify declined occurrences
-        instance_events_result = self.service.events().list(
+        instance_events = self._iter_items(
+            self.events_api, 'list',
             calendarId=self.target_calendar_id,
             timeMin=time_min,
             timeMax=time_max,
             singleEvents=True,  # Get individual instances
-            orderBy='startTime'
-        ).execute()
+            showDeleted=True,  # Declined occurrences are returned as cancelled instances
+            orderBy='startTime',
+            maxResults=EVENTS_PAGE_SIZE,
+            fields=INSTANCE_FIELDS
+        )
         
         # Create a map of recurring event IDs to their instances
-        recurring_event_instances = {}
-        for event in instance_events_result.get('items', []):
+        recurring_event_instances = defaultdict(list)
+        for event in instance_events:
             # Check if this is an instance of a recurring event
             if 'recurringEventId' in event:
-                master_id = event['recurringEventId']
-                if master_id not in recurring_event_instances:
-                    recurring_event_instances[master_id] = []
-                recurring_event_instances[master_id].append(event)
+                recurring_event_instances[event['recurringEventId']].append(event)
         
         # Process the master events and attach instance info
         google_events = {}
-        for event in master_events_result.get('items', []):
+        for event in master_events:
             # Only consider events that we created from external calendar
             if event.get('extendedProperties', {}).get('private', {}).get('externalCalendarId') == self.ical_url:
                 ext_id = event.get('extendedProperties', {}).get('private', {}).get('externalEventId')
@@ -351,7 +582,7 @@ class CalendarSync:
                             if instance.get('status') == 'cancelled'
                         ]
                         if declined_instances:
-                            logger.info(f"Found {len(declined_instances)} declined instances for recurring event: {event.get('summary')}")
+                            logger.info("Found %s declined instances for recurring event: %s", len(declined_instances), event.get('summary'))
                     
                     google_events[ext_id] = event
                     
@@ -361,30 +592,38 @@ class CalendarSync:
         """Get existing Google Calendar event by iCalUID."""
         try:
             # Try to find existing event with this UID
-            existing_events = self.service.events().list(
+            existing_events = self.events_api.list(
                 calendarId=self.target_calendar_id,
                 iCalUID=ical_uid,
-                singleEvents=False  # Important: Get the recurring event master, not instances
+                singleEvents=False,  # Important: Get the recurring event master, not instances
+                fields=MASTER_EVENT_FIELDS
             ).execute()
             
             if existing_events.get('items'):
                 master_event = existing_events['items'][0]
-                logger.info(f"Found existing event by iCalUID: {master_event.get('summary')}")
+                logger.info("Found existing event by iCalUID: %s", master_event.get('summary'))
                 
                 # Check if it's a recurring event
                 if 'recurrence' in master_event:
-                    logger.info(f"This is a recurring event with rule: {master_event['recurrence']}")
+                    logger.info("This is a recurring event with rule: %s", master_event['recurrence'])
                     
                     # Also fetch the instances to get exceptions (declined, modified instances)
                     try:
-                        instances = self.service.events().instances(
-                            calendarId=self.target_calendar_id,
-                            eventId=master_event['id']
-                        ).execute()
+                        # Only expand the recurrence within the sync window; a long-running
+                        # series would otherwise return every occurrence it ever had
+                        time_min, time_max = self._sync_window()
                         
                         # Add information about instances to the master event for reference
-                        master_event['_instances'] = instances.get('items', [])
-                        logger.info(f"Found {len(master_event['_instances'])} instances of recurring event")
+                        master_event['_instances'] = list(self._iter_items(
+                            self.events_api, 'instances',
+                            calendarId=self.target_calendar_id,
+                            eventId=master_event['id'],
+                            timeMin=time_min,
+                            timeMax=time_max,
+                            maxResults=EVENTS_PAGE_SIZE,
+                            fields=INSTANCE_FIELDS
+                        ))
+                        logger.info("Found %s instances of recurring event", len(master_event['_instances']))
                         
                         # Log any declined instances
                         declined_instances = [
@@ -392,17 +631,17 @@ class CalendarSync:
                             if instance.get('status') == 'cancelled'
                         ]
                         if declined_instances:
-                            logger.info(f"Found {len(declined_instances)} declined instances of recurring event")
+                            logger.info("Found %s declined instances of recurring event", len(declined_instances))
                     except Exception as e:
-                        logger.error(f"Error fetching instances of recurring event: {e}")
+                        logger.error("Error fetching instances of recurring event: %s", e)
                 
                 return master_event
         except Exception as e:
-            logger.error(f"Error finding event by iCalUID: {e}")
+            logger.error("Error finding event by iCalUID: %s", e)
         
         return None
         
-    def _create_or_update_recurring_event(self, google_event):
+    def _create_or_update_recurring_event(self, google_event, existing=None):
         """
         Special handling for recurring events to ensure they're created properly,
         and that any declined instances are preserved during updates.
@@ -421,19 +660,23 @@ class CalendarSync:
         This ensures that when a user declines a specific instance of a recurring meeting,
         that declined status persists even when the master event is updated from the
         source calendar.
+        
+        Callers that have already looked up the master event by iCalUID can pass it
+        as ``existing`` to skip a second lookup.
         """
         if 'recurrence' not in google_event:
             return None
             
         try:
-            logger.info(f"Special handling for recurring event: {google_event.get('summary')}")
+            logger.info("Special handling for recurring event: %s", google_event.get('summary'))
             
             # First try to find by iCalUID
-            existing = self._get_event_by_icaluid(google_event['iCalUID'])
+            if existing is None:
+                existing = self._get_event_by_icaluid(google_event['iCalUID'])
             
             if existing:
                 # Update existing recurring event
-                logger.info(f"Updating existing recurring event: {existing.get('id')}")
+                logger.info("Updating existing recurring event: %s", existing.get('id'))
                 
                 # Store the event ID for later use with instances
                 event_id = existing['id']
@@ -441,25 +684,28 @@ class CalendarSync:
                 # CRITICAL STEP 1: Find and store declined instances BEFORE updating the master event
                 # ALWAYS fetch the latest instance information directly from Google Calendar
                 try:
-                    instances_result = self.service.events().instances(
+                    instances = self._iter_items(
+                        self.events_api, 'instances',
                         calendarId=self.target_calendar_id,
-                        eventId=event_id
-                    ).execute()
+                        eventId=event_id,
+                        maxResults=EVENTS_PAGE_SIZE,
+                        fields=INSTANCE_FIELDS
+                    )
                     
                     # Find all declined/cancelled instances before updating
                     declined_instances = [
-                        instance for instance in instances_result.get('items', []) 
+                        instance for instance in instances 
                         if instance.get('status') == 'cancelled'
                     ]
                     
                     if declined_instances:
-                        logger.info(f"Found {len(declined_instances)} declined instances that need to be preserved")
+                        logger.info("Found %s declined instances that need to be preserved", len(declined_instances))
                         for instance in declined_instances:
-                            instance_date = instance.get('originalStartTime', {}).get('dateTime') or instance.get('originalStartTime', {}).get('date')
-                            logger.info(f"  Declined instance on {instance_date} with ID {instance.get('id')}")
+                            instance_date = _original_start(instance)
+                            logger.info("  Declined instance on %s with ID %s", instance_date, instance.get('id'))
                     
                 except Exception as e:
-                    logger.error(f"Error fetching instances directly: {e}")
+                    logger.error("Error fetching instances directly: %s", e)
                     declined_instances = []
                     
                     # Fallback to cached instances if available
@@ -469,65 +715,85 @@ class CalendarSync:
                             instance for instance in existing['_instances'] 
                             if instance.get('status') == 'cancelled'
                         ]
-                        logger.info(f"Using cached data: Preserving {len(declined_instances)} declined instances during update")
+                        logger.info("Using cached data: Preserving %s declined instances during update", len(declined_instances))
                 
                 # Remove our custom field before update if it exists
                 if '_instances' in existing:
                     del existing['_instances']
                 
                 # CRITICAL STEP 2: Update the master event - this will reset all instances
-                updated = self.service.events().update(
+                updated = self.events_api.update(
                     calendarId=self.target_calendar_id,
                     eventId=event_id,
                     body=google_event
                 ).execute()
+                self._record_write(updated)
                 
                 # CRITICAL STEP 3: Re-apply declined status to instances that were previously declined
+                # All patches are sent together as batch requests rather than one round trip each
+                instance_dates = {}
+                patch_requests = []
                 for instance in declined_instances:
-                    try:
-                        # Get the instance ID and date
-                        instance_id = instance['id']
-                        instance_date = instance.get('originalStartTime', {}).get('dateTime') or instance.get('originalStartTime', {}).get('date')
-                        
-                        logger.info(f"Re-applying declined status to instance on {instance_date}")
-                        
-                        # Cancel/decline this specific instance
-                        updated_instance = self.service.events().patch(
-                            calendarId=self.target_calendar_id,
-                            eventId=instance_id,
-                            body={'status': 'cancelled'}
-                        ).execute()
-                        
-                        if updated_instance.get('status') == 'cancelled':
-                            logger.info(f"Successfully preserved declined status for instance on {instance_date}")
-                        else:
-                            logger.warning(f"Failed to preserve declined status for instance on {instance_date}")
-                    except Exception as e:
-                        logger.error(f"Error preserving declined instance: {e}")
+                    # Get the instance ID and date
+                    instance_id = instance['id']
+                    instance_date = _original_start(instance)
+                    instance_dates[instance_id] = instance_date
+                    
+                    logger.info("Re-applying declined status to instance on %s", instance_date)
+                    
+                    # Cancel/decline this specific instance
+                    patch_requests.append((instance_id, self.events_api.patch(
+                        calendarId=self.target_calendar_id,
+                        eventId=instance_id,
+                        body={'status': 'cancelled'},
+                        fields='id,status,updated'
+                    )))
+                
+                def check_declined_patch(request_id, updated_instance, exception):
+                    instance_date = instance_dates[request_id]
+                    if exception is not None:
+                        self._pass_write_failures += 1
+                        logger.error("Error preserving declined instance on %s: %s", instance_date, exception)
+                        return
+                    self._record_write(updated_instance)
+                    if updated_instance.get('status') == 'cancelled':
+                        logger.info("Successfully preserved declined status for instance on %s", instance_date)
+                    else:
+                        self._pass_write_failures += 1
+                        logger.warning("Failed to preserve declined status for instance on %s", instance_date)
+                
+                try:
+                    self._execute_batch(patch_requests, check_declined_patch)
+                except Exception as e:
+                    self._pass_write_failures += 1
+                    logger.error("Error preserving declined instances: %s", e)
                 
                 # CRITICAL STEP 4: Verify that declined instances were actually preserved
                 try:
-                    verify_instances = self.service.events().instances(
+                    verify_instances = self._iter_items(
+                        self.events_api, 'instances',
                         calendarId=self.target_calendar_id,
-                        eventId=event_id
-                    ).execute()
+                        eventId=event_id,
+                        maxResults=EVENTS_PAGE_SIZE,
+                        fields=INSTANCE_FIELDS
+                    )
                     
                     verified_declined = [
-                        instance for instance in verify_instances.get('items', []) 
+                        instance for instance in verify_instances 
                         if instance.get('status') == 'cancelled'
                     ]
                     
                     if verified_declined:
-                        logger.info(f"Verification: Successfully preserved {len(verified_declined)} declined instances")
+                        logger.info("Verification: Successfully preserved %s declined instances", len(verified_declined))
                     else:
-                        logger.warning(f"Verification: No declined instances were preserved! This is likely a bug.")
+                        logger.warning("Verification: No declined instances were preserved! This is likely a bug.")
                 except Exception as e:
-                    logger.error(f"Error verifying declined instances: {e}")
+                    logger.error("Error verifying declined instances: %s", e)
                 
                 return updated
             else:
                 # Try direct insert with recurrence rule
-                logger.info(f"Creating new recurring event with rule: {google_event['recurrence']}")
+                logger.info("Creating new recurring event with rule: %s", google_event['recurrence'])
                 
                 # Ensure time zone is set for recurring events
                 for time_field in ['start', 'end']:
@@ -539,35 +805,176 @@ class CalendarSync:
                 if 'iCalUID' in event_copy:
                     del event_copy['iCalUID']
                     
-                created = self.service.events().insert(
+                created = self.events_api.insert(
                     calendarId=self.target_calendar_id,
                     body=event_copy
                 ).execute()
+                self._record_write(created)
                 
-                logger.info(f"Successfully created recurring event: {created.get('id')}")
+                logger.info("Successfully created recurring event: %s", created.get('id'))
                 return created
                 
         except Exception as e:
-            logger.error(f"Error in special recurring event handling: {e}")
+            logger.error("Error in special recurring event handling: %s", e)
             return None
     
+    def _import_event(self, google_event):
+        """
+        Import a new event into the target calendar, falling back to a plain insert.
+        
+        Import keeps the source iCalUID, which avoids duplicates. If Google rejects
+        the import, the event is inserted without its iCalUID instead. If that fails
+        too, it counts towards the current pass's failed writes.
+        
+        Args:
+            google_event (dict): Event in Google Calendar format
+            
+        Returns:
+            bool: True if the event was created
+        """
+        try:
+            # Log the event details before import
+            logger.info("Attempting to import event: %s", google_event.get('summary'))
+            if 'recurrence' in google_event:
+                logger.info("With recurrence: %s", google_event['recurrence'])
+            
+            imported = self.events_api.import_(
+                calendarId=self.target_calendar_id,
+                body=google_event
+            ).execute()
+            self._record_write(imported)
+            logger.info("Successfully imported event: %s", google_event.get('summary'))
+            return True
+        except Exception as e:
+            logger.error("Error importing event: %s", e)
+        
+        # Fall back to insert if import fails
+        try:
+            # Make a clean copy for insertion
+            event_copy = google_event.copy()
+            
+            # Remove problematic fields if present
+            if 'iCalUID' in event_copy:
+                logger.info("Removing iCalUID for direct insert")
+                del event_copy['iCalUID']
+            
+            # Ensure explicit timezone for recurring events
+            if 'recurrence' in event_copy:
+                logger.info("Ensuring timezone for recurring event insert: %s", event_copy.get('summary'))
+                
+                # Make sure start/end have timeZone with UTC instead of hardcoded timezone
+                for time_field in ['start', 'end']:
+                    if 'dateTime' in event_copy[time_field] and 'timeZone' not in event_copy[time_field]:
+                        event_copy[time_field]['timeZone'] = 'UTC'
+            
+            logger.info("Attempting direct insert for: %s", event_copy.get('summary'))
+            created_event = self.events_api.insert(
+                calendarId=self.target_calendar_id,
+                body=event_copy
+            ).execute()
+            self._record_write(created_event)
+            
+            logger.info("Successfully inserted event: %s with ID: %s", event_copy.get('summary'), created_event.get('id'))
+            return True
+        except Exception as insert_e:
+            self._pass_write_failures += 1
+            logger.error("Error creating event: %s", insert_e)
+            return False
+    
+    def _update_events(self, updates):
+        """
+        Replace events in the target calendar using batched requests.
+        
+        Failures are logged and counted towards the current pass's failed writes.
+        
+        Args:
+            updates (dict): Google event ID mapped to the new event body
+            
+        Returns:
+            int: Number of events updated
+        """
+        updated = []
+        
+        def check_update(request_id, response, exception):
+            if exception is not None:
+                self._pass_write_failures += 1
+                logger.error("Error updating event %s: %s", updates[request_id].get('summary'), exception)
+            else:
+                self._record_write(response)
+                updated.append(request_id)
+        
+        self._execute_batch(
+            [(event_id, self.events_api.update(
+                calendarId=self.target_calendar_id,
+                eventId=event_id,
+                body=body
+            )) for event_id, body in updates.items()],
+            check_update
+        )
+        return len(updated)
+    
+    def _delete_events(self, events):
+        """
+        Delete events from the target calendar using batched requests.
+        
+        Failures are logged and counted towards the current pass's failed writes.
+        
+        Args:
+            events (list): Google Calendar events to delete
+            
+        Returns:
+            int: Number of events deleted
+        """
+        events_by_id = {event['id']: event for event in events}
+        deleted = []
+        
+        def check_delete(request_id, response, exception):
+            event = events_by_id[request_id]
+            if exception is not None:
+                self._pass_write_failures += 1
+                logger.error("Error deleting event %s: %s", event.get('summary'), exception)
+            else:
+                self._pass_writes[request_id] = None
+                deleted.append(request_id)
+                logger.info("Deleted event %s (no longer in source)", event.get('summary'))
+        
+        self._execute_batch(
+            [(event_id, self.events_api.delete(
+                calendarId=self.target_calendar_id,
+                eventId=event_id
+            )) for event_id in events_by_id],
+            check_delete
+        )
+        return len(deleted)
+    
     def initial_sync(self):
         """Perform the initial sync of calendar events."""
         logger.info("Starting initial sync...")
         
+        # Start tracking from scratch in case this instance has synced before
+        self.synced_events = {}
+        
         # Fetch external calendar
         ical_calendar = self.fetch_ical_events()
         if not ical_calendar:
             logger.error("Failed to fetch external calendar. Aborting sync.")
             return
         
+        # Taken before reading Google so edits made while this pass runs are seen next time
+        pass_started = self._begin_pass()
+        
         # Get existing Google Calendar events
         google_events = self._get_google_events()
-        logger.info(f"Found {len(google_events)} existing events in Google Calendar")
+        logger.info("Found %s existing events in Google Calendar", len(google_events))
         
         # Process all events from the iCal file
         events_added = 0
         events_updated = 0
+        # Plain updates are collected and sent in batches once all events are processed
+        pending_updates = {}
+        
+        # Every event synced in this pass gets the same timestamp in its description
+        synced_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         for component in ical_calendar.walk():
             if component.name == "VEVENT":
@@ -579,42 +986,40 @@ class CalendarSync:
                     continue
                 
                 # Convert to Google format
-                google_event = self._convert_ical_to_google_event(component)
+                google_event = self._convert_ical_to_google_event(component, synced_at)
                 
                 # If the event already exists in Google Calendar by UID in our tracking
                 if event_uid in google_events:
                     # Update the event
                     existing_event = google_events[event_uid]
                     
-                    # Check if this is a recurring event
+                    # Check if this is a recurring event; the master was already fetched
+                    # by _get_google_events, so there is no need to look it up again
                     if 'recurrence' in google_event:
-                        # Fetch full event info including instances
-                        full_event = self._get_event_by_icaluid(google_event['iCalUID'])
-                        if full_event and '_instances' in full_event:
+                        if 'recurrence' in existing_event:
                             # Use special handling for recurring events
-                            logger.info(f"Using special recurring event handling for existing event during initial sync")
-                            result = self._create_or_update_recurring_event(google_event)
+                            logger.info("Using special recurring event handling for existing event during initial sync")
+                            result = self._create_or_update_recurring_event(google_event, existing_event)
                             if result:
+                                # A plain update queued earlier for this event must not land after this write
+                                pending_updates.pop(result['id'], None)
                                 events_updated += 1
                                 continue
                     
                     # Regular update if not recurring or special handling failed
-                    self.service.events().update(
-                        calendarId=self.target_calendar_id,
-                        eventId=existing_event['id'],
-                        body=google_event
-                    ).execute()
-                    events_updated += 1
+                    pending_updates[existing_event['id']] = google_event
                 else:
                     # Special handling for recurring events
                     if 'recurrence' in google_event:
-                        logger.info(f"Using special handling for recurring event: {google_event.get('summary')}")
+                        logger.info("Using special handling for recurring event: %s", google_event.get('summary'))
                         result = self._create_or_update_recurring_event(google_event)
                         
                         if result:
+                            # A plain update queued earlier for this event must not land after this write
+                            pending_updates.pop(result['id'], None)
                             if result.get('status') == 'confirmed':
                                 events_added += 1
-                                logger.info(f"Successfully created/updated recurring event: {google_event.get('summary')}")
+                                logger.info("Successfully created/updated recurring event: %s", google_event.get('summary'))
                             continue
                     
                     # Regular handling for non-recurring events or if special handling failed
@@ -622,77 +1027,30 @@ class CalendarSync:
                     
                     if existing_event:
                         # Update the existing event
-                        self.service.events().update(
-                            calendarId=self.target_calendar_id,
-                            eventId=existing_event['id'],
-                            body=google_event
-                        ).execute()
-                        events_updated += 1
-                        logger.info(f"Updated existing event with UID: {event_uid}")
+                        pending_updates[existing_event['id']] = google_event
+                        logger.info("Updating existing event with UID: %s", event_uid)
                     else:
                         # Create new event with import flag to avoid duplicates
-                        try:
-                            # Log the event details before import
-                            logger.info(f"Attempting to import event: {google_event.get('summary')}")
-                            if 'recurrence' in google_event:
-                                logger.info(f"With recurrence: {google_event['recurrence']}")
-                            
-                            self.service.events().import_(
-                                calendarId=self.target_calendar_id,
-                                body=google_event
-                            ).execute()
+                        if self._import_event(google_event):
                             events_added += 1
-                            logger.info(f"Successfully imported event: {google_event.get('summary')}")
-                        except Exception as e:
-                            logger.error(f"Error importing event: {e}")
-                            
-                            # Fall back to insert if import fails
-                            try:
-                                # Make a clean copy for insertion
-                                event_copy = google_event.copy()
-                                
-                                # Remove problematic fields if present
-                                if 'iCalUID' in event_copy:
-                                    logger.info(f"Removing iCalUID for direct insert")
-                                    del event_copy['iCalUID']
-                                
-                                # Ensure explicit timezone for recurring events
-                                if 'recurrence' in event_copy:
-                                    logger.info(f"Ensuring timezone for recurring event insert: {event_copy.get('summary')}")
-                                    
-                                    # Make sure start/end have timeZone with UTC instead of hardcoded timezone
-                                    for time_field in ['start', 'end']:
-                                        if 'dateTime' in event_copy[time_field] and 'timeZone' not in event_copy[time_field]:
-                                            event_copy[time_field]['timeZone'] = 'UTC'
-                                
-                                logger.info(f"Attempting direct insert for: {event_copy.get('summary')}")
-                                created_event = self.service.events().insert(
-                                    calendarId=self.target_calendar_id,
-                                    body=event_copy
-                                ).execute()
-                                
-                                events_added += 1
-                                logger.info(f"Successfully inserted event: {event_copy.get('summary')} with ID: {created_event.get('id')}")
-                            except Exception as insert_e:
-                                logger.error(f"Error creating event: {insert_e}")
                 
                 # Keep track of synced events
                 self.synced_events[event_uid] = True
         
+        events_updated += self._update_events(pending_updates)
+        
         # Find and delete events that no longer exist in the source calendar
-        for ext_id, event in google_events.items():
-            if ext_id not in self.synced_events:
-                self.service.events().delete(
-                    calendarId=self.target_calendar_id,
-                    eventId=event['id']
-                ).execute()
-                logger.info(f"Deleted event {event.get('summary')} (no longer in source)")
+        self._delete_events([
+            event for ext_id, event in google_events.items()
+            if ext_id not in self.synced_events
+        ])
         
-        logger.info(f"Initial sync complete. Added {events_added} events, updated {events_updated} events.")
+        self._finish_pass(pass_started)
+        logger.info("Initial sync complete. Added %s events, updated %s events.", events_added, events_updated)
     
     def debug_examine_calendar(self, search_term=None, day_of_week=None):
         """Debug helper to examine events in the source calendar."""
-        logger.info(f"Examining source calendar for events matching: {search_term} or day of week: {day_of_week}")
+        logger.info("Examining source calendar for events matching: %s or day of week: %s", search_term, day_of_week)
         
         # Fetch external calendar
         ical_calendar = self.fetch_ical_events()
@@ -705,6 +1063,10 @@ class CalendarSync:
         cancelled_events = 0
         exceptions_found = 0
         
+        # Normalise the filters once instead of per event
+        needle = search_term.lower() if search_term else None
+        day_needle = day_of_week.lower() if day_of_week else None
+        
         for component in ical_calendar.walk():
             if component.name == "VEVENT":
                 summary = str(component.get('SUMMARY', 'No Title'))
@@ -712,15 +1074,13 @@ class CalendarSync:
                 start = component.get('DTSTART').dt
                 
                 # Check if event matches search criteria
-                matches_search = search_term and search_term.lower() in summary.lower()
+                matches_search = needle and needle in summary.lower()
                 
                 # Check for day of week
                 matches_day = False
-                if day_of_week and hasattr(start, 'weekday'):
-                    weekday = start.weekday()
-                    weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                    day_str = weekday_names[weekday]
-                    matches_day = day_of_week.lower() == day_str.lower()
+                if day_needle and hasattr(start, 'weekday'):
+                    day_str = WEEKDAY_NAMES[start.weekday()]
+                    matches_day = day_needle == day_str.lower()
                 
                 if matches_search or matches_day or not (search_term or day_of_week):
                     events_found += 1
@@ -729,34 +1089,33 @@ class CalendarSync:
                     if is_recurring:
                         recurring_events += 1
                     
-                    logger.info(f"Found event: {summary}")
-                    logger.info(f"  UID: {uid}")
-                    logger.info(f"  Start: {start}")
+                    logger.info("Found event: %s", summary)
+                    logger.info("  UID: %s", uid)
+                    logger.info("  Start: %s", start)
                     
                     # Check for cancellation in the summary
-                    event_summary = str(component.get('SUMMARY', ''))
-                    if event_summary.startswith('Canceled:') or event_summary.startswith('Cancelled:'):
+                    if summary.startswith(CANCELLED_PREFIXES):
                         cancelled_events += 1
-                        logger.info(f"  Event is CANCELLED via summary prefix in source calendar!")
+                        logger.info("  Event is CANCELLED via summary prefix in source calendar!")
                     
                     # Check for STATUS property
                     status = component.get('STATUS')
                     if status:
-                        logger.info(f"  Status: {status}")
+                        logger.info("  Status: %s", status)
                         if str(status).upper() == 'CANCELLED':
                             cancelled_events += 1
-                            logger.info(f"  Event is CANCELLED via STATUS in source calendar!")
+                            logger.info("  Event is CANCELLED via STATUS in source calendar!")
                     
                     # Check for RECURRENCE-ID (indicates exception to recurring event)
                     recurrence_id = component.get('RECURRENCE-ID')
                     if recurrence_id:
                         exceptions_found += 1
-                        logger.info(f"  This is an EXCEPTION to a recurring event for date: {recurrence_id.dt}")
+                        logger.info("  This is an EXCEPTION to a recurring event for date: %s", recurrence_id.dt)
                         
-                    # Check for attendee status
+                    # Check for attendee status (only logged, so skip the parsing when INFO is off)
                     attendee = component.get('ATTENDEE')
-                    if attendee:
-                        logger.info(f"  Event has attendees:")
+                    if attendee and logger.isEnabledFor(logging.INFO):
+                        logger.info("  Event has attendees:")
                         for att in attendee if isinstance(attendee, list) else [attendee]:
                             att_str = str(att)
                             # Look for participation status
@@ -773,78 +1132,100 @@ class CalendarSync:
                                 email_start = att_str.find('mailto:') + 7 if 'mailto:' in att_str else att_str.rfind(':') + 1
                                 email = att_str[email_start:]
                                 
-                                logger.info(f"    Attendee: {email}, Status: {partstat}")
+                                logger.info("    Attendee: %s, Status: %s", email, partstat)
                                 
                                 # If the attendee has declined and it's the user, mark this
                                 if partstat == 'DECLINED':
-                                    logger.info(f"    Attendee {email} has DECLINED this event")
+                                    logger.info("    Attendee %s has DECLINED this event", email)
                     
-                    logger.info(f"  Is recurring: {is_recurring}")
+                    logger.info("  Is recurring: %s", is_recurring)
                     if is_recurring:
-                        logger.info(f"  Recurrence rule: {rrule}")
+                        logger.info("  Recurrence rule: %s", rrule)
         
-        logger.info(f"Examination complete. Found {events_found} matching events:")
-        logger.info(f"  - {recurring_events} are recurring events")
-        logger.info(f"  - {exceptions_found} are exceptions to recurring events")  
-        logger.info(f"  - {cancelled_events} are cancelled in the source calendar")
+        logger.info("Examination complete. Found %s matching events:", events_found)
+        logger.info("  - %s are recurring events", recurring_events)
+        logger.info("  - %s are exceptions to recurring events", exceptions_found)  
+        logger.info("  - %s are cancelled in the source calendar", cancelled_events)
         return events_found
     
     def debug_check_recurring_events(self, search_term=None):
         """Debug helper to examine recurring events and their instances in Google Calendar."""
-        logger.info(f"Examining Google Calendar for recurring events matching: {search_term}")
+        logger.info("Examining Google Calendar for recurring events matching: %s", search_term)
         
         # Get time range
-        time_min = (datetime.utcnow() - timedelta(days=self.days_back)).isoformat() + 'Z'
-        time_max = (datetime.utcnow() + timedelta(days=self.days_forward)).isoformat() + 'Z'
+        time_min, time_max = self._sync_window()
+        
+        # Let the server narrow the listing down when searching. Its free-text match
+        # also covers descriptions and locations, so the summary check below stays
+        search_params = {'q': search_term} if search_term else {}
         
         # First get recurring events (master events)
-        master_events_result = self.service.events().list(
+        master_events = self._iter_items(
+            self.events_api, 'list',
             calendarId=self.target_calendar_id,
             timeMin=time_min,
             timeMax=time_max,
             singleEvents=False,  # Get master events
-            orderBy='updated'
-        ).execute()
-        
-        recurring_events = []
-        for event in master_events_result.get('items', []):
-            if 'recurrence' in event:
-                # Check for search term
-                if search_term and search_term.lower() not in event.get('summary', '').lower():
-                    continue
-                
-                recurring_events.append(event)
-                
-                logger.info(f"Found recurring event: {event.get('summary')}")
-                logger.info(f"  ID: {event.get('id')}")
-                logger.info(f"  iCalUID: {event.get('iCalUID', 'None')}")
-                logger.info(f"  Recurrence: {event.get('recurrence')}")
-                
-                # Get instances of this recurring event
-                try:
-                    instances = self.service.events().instances(
-                        calendarId=self.target_calendar_id,
-                        eventId=event['id']
-                    ).execute()
-                    
-                    logger.info(f"  Found {len(instances.get('items', []))} instances of this event")
-                    
-                    # Check for declined/cancelled instances
-                    declined_instances = [
-                        instance for instance in instances.get('items', [])
-                        if instance.get('status') == 'cancelled'
-                    ]
-                    
-                    if declined_instances:
-                        logger.info(f"  {len(declined_instances)} instances are marked as declined/cancelled:")
-                        for declined in declined_instances:
-                            start_date = declined.get('originalStartTime', {}).get('dateTime') or declined.get('originalStartTime', {}).get('date')
-                            logger.info(f"    Declined instance on {start_date}")
-                
-                except Exception as e:
-                    logger.error(f"  Error fetching instances: {e}")
+            orderBy='updated',
+            maxResults=EVENTS_PAGE_SIZE,
+            fields=MASTER_EVENT_FIELDS,
+            **search_params
+        )
         
-        logger.info(f"Recurring event examination complete. Found {len(recurring_events)} recurring events.")
+        needle = search_term.lower() if search_term else None
+        recurring_events = [
+            event for event in master_events
+            if 'recurrence' in event
+            # Check for search term
+            and (not needle or needle in event.get('summary', '').lower())
+        ]
+        
+        # Expand all recurring events in the window with a single listing rather than
+        # one instances() call per master; showDeleted keeps cancelled occurrences
+        instances_by_master = defaultdict(list)
+        try:
+            instance_events = self._iter_items(
+                self.events_api, 'list',
+                calendarId=self.target_calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                showDeleted=True,
+                maxResults=EVENTS_PAGE_SIZE,
+                fields=INSTANCE_FIELDS
+            )
+            for instance in instance_events:
+                if 'recurringEventId' in instance:
+                    instances_by_master[instance['recurringEventId']].append(instance)
+        except Exception as e:
+            logger.error("Error fetching instances of recurring events: %s", e)
+            instances_by_master = None
+        
+        for event in recurring_events:
+            logger.info("Found recurring event: %s", event.get('summary'))
+            logger.info("  ID: %s", event.get('id'))
+            logger.info("  iCalUID: %s", event.get('iCalUID', 'None'))
+            logger.info("  Recurrence: %s", event.get('recurrence'))
+            
+            if instances_by_master is None:
+                continue
+            
+            instances = instances_by_master.get(event['id'], [])
+            logger.info("  Found %s instances of this event", len(instances))
+            
+            # Check for declined/cancelled instances
+            declined_instances = [
+                instance for instance in instances
+                if instance.get('status') == 'cancelled'
+            ]
+            
+            if declined_instances and logger.isEnabledFor(logging.INFO):
+                logger.info("  %s instances are marked as declined/cancelled:", len(declined_instances))
+                for declined in declined_instances:
+                    start_date = _original_start(declined)
+                    logger.info("    Declined instance on %s", start_date)
+        
+        logger.info("Recurring event examination complete. Found %s recurring events.", len(recurring_events))
         return recurring_events
     
     def incremental_sync(self):
@@ -857,6 +1238,14 @@ class CalendarSync:
             logger.error("Failed to fetch external calendar. Aborting sync.")
             return
         
+        # Nothing to reconcile if neither side has changed since the last pass
+        if self._ical_unchanged and not self._google_changed_since_last_sync():
+            logger.info("No changes in either calendar since the last sync. Skipping incremental sync.")
+            return
+        
+        # Taken before reading Google so edits made while this pass runs are seen next time
+        pass_started = self._begin_pass()
+        
         # Get existing Google Calendar events
         google_events = self._get_google_events()
         
@@ -865,17 +1254,22 @@ class CalendarSync:
         for uid, event in google_events.items():
             if 'recurrence' in event and '_instances' in event:
                 recurring_events_cache[uid] = event['_instances']
-                logger.info(f"Caching {len(event['_instances'])} instances for recurring event {event.get('summary')}")
+                logger.info("Caching %s instances for recurring event %s", len(event['_instances']), event.get('summary'))
                 
                 # Look for declined instances
                 declined = [inst for inst in event['_instances'] if inst.get('status') == 'cancelled']
                 if declined:
-                    logger.info(f"Found {len(declined)} declined instances to preserve")
+                    logger.info("Found %s declined instances to preserve", len(declined))
         
         # Track the events that still exist
         current_events = {}
         events_added = 0
         events_updated = 0
+        # Plain updates are collected and sent in batches once all events are processed
+        pending_updates = {}
+        
+        # Every event synced in this pass gets the same timestamp in its description
+        synced_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         for component in ical_calendar.walk():
             if component.name == "VEVENT":
@@ -890,7 +1284,7 @@ class CalendarSync:
                 current_events[event_uid] = True
                 
                 # Convert to Google format
-                google_event = self._convert_ical_to_google_event(component)
+                google_event = self._convert_ical_to_google_event(component, synced_at)
                 
                 # Check if this is a recurring event that needs special handling
                 is_recurring = 'recurrence' in google_event
@@ -902,20 +1296,17 @@ class CalendarSync:
                     
                     # Special handling for recurring events to preserve declined instances
                     if is_recurring:
-                        logger.info(f"Using special recurring event handling for existing tracked event during incremental sync")
-                        result = self._create_or_update_recurring_event(google_event)
+                        logger.info("Using special recurring event handling for existing tracked event during incremental sync")
+                        result = self._create_or_update_recurring_event(google_event, existing_event)
                         if result:
+                            # A plain update queued earlier for this event must not land after this write
+                            pending_updates.pop(result['id'], None)
                             events_updated += 1
-                            logger.info(f"Updated recurring event with preserved declined instances")
+                            logger.info("Updated recurring event with preserved declined instances")
                             continue
                     
                     # Normal update if not recurring or special handling failed
-                    self.service.events().update(
-                        calendarId=self.target_calendar_id,
-                        eventId=existing_event['id'],
-                        body=google_event
-                    ).execute()
-                    events_updated += 1
+                    pending_updates[existing_event['id']] = google_event
                 else:
                     # Check if event exists by iCalUID
                     existing_event = self._get_event_by_icaluid(google_event['iCalUID'])
@@ -924,103 +1315,67 @@ class CalendarSync:
                         # Special handling for recurring events to preserve declined instances
                         if is_recurring:
                             # Use the special handling for recurring events
-                            logger.info(f"Using special recurring event handling for existing event by iCalUID during incremental sync")
-                            result = self._create_or_update_recurring_event(google_event)
+                            logger.info("Using special recurring event handling for existing event by iCalUID during incremental sync")
+                            result = self._create_or_update_recurring_event(google_event, existing_event)
                             if result:
+                                # A plain update queued earlier for this event must not land after this write
+                                pending_updates.pop(result['id'], None)
                                 events_updated += 1
-                                logger.info(f"Updated recurring event with preserved declined instances")
+                                logger.info("Updated recurring event with preserved declined instances")
                                 continue
                         
                         # Normal update if not recurring or special handling failed
-                        self.service.events().update(
-                            calendarId=self.target_calendar_id,
-                            eventId=existing_event['id'],
-                            body=google_event
-                        ).execute()
-                        events_updated += 1
+                        pending_updates[existing_event['id']] = google_event
                     else:
                         # Create new event with import flag to avoid duplicates
-                        try:
-                            # Log the event details before import
-                            logger.info(f"Attempting to import event in incremental sync: {google_event.get('summary')}")
-                            if 'recurrence' in google_event:
-                                logger.info(f"With recurrence: {google_event['recurrence']}")
-                            
-                            self.service.events().import_(
-                                calendarId=self.target_calendar_id,
-                                body=google_event
-                            ).execute()
+                        if self._import_event(google_event):
                             events_added += 1
-                            logger.info(f"Successfully imported event in incremental sync: {google_event.get('summary')}")
-                        except Exception as e:
-                            logger.error(f"Error importing event in incremental sync: {e}")
-                            
-                            # Fall back to insert if import fails
-                            try:
-                                # Make a clean copy for insertion
-                                event_copy = google_event.copy()
-                                
-                                # Remove problematic fields if present
-                                if 'iCalUID' in event_copy:
-                                    logger.info(f"Removing iCalUID for direct insert in incremental sync")
-                                    del event_copy['iCalUID']
-                                
-                                # Ensure explicit timezone for recurring events
-                                if 'recurrence' in event_copy:
-                                    logger.info(f"Ensuring timezone for recurring event insert in incremental sync: {event_copy.get('summary')}")
-                                    
-                                    # Make sure start/end have timeZone with UTC instead of hardcoded timezone
-                                    for time_field in ['start', 'end']:
-                                        if 'dateTime' in event_copy[time_field] and 'timeZone' not in event_copy[time_field]:
-                                            event_copy[time_field]['timeZone'] = 'UTC'
-                                
-                                logger.info(f"Attempting direct insert in incremental sync for: {event_copy.get('summary')}")
-                                created_event = self.service.events().insert(
-                                    calendarId=self.target_calendar_id,
-                                    body=event_copy
-                                ).execute()
-                                
-                                events_added += 1
-                                logger.info(f"Successfully inserted event in incremental sync: {event_copy.get('summary')} with ID: {created_event.get('id')}")
-                            except Exception as insert_e:
-                                logger.error(f"Error creating event in incremental sync: {insert_e}")
+        
+        events_updated += self._update_events(pending_updates)
         
         # Find and delete events that no longer exist in the source calendar
-        events_deleted = 0
-        for ext_id, event in google_events.items():
-            if ext_id not in current_events:
-                self.service.events().delete(
-                    calendarId=self.target_calendar_id,
-                    eventId=event['id']
-                ).execute()
-                events_deleted += 1
+        events_deleted = self._delete_events([
+            event for ext_id, event in google_events.items()
+            if ext_id not in current_events
+        ])
         
-        logger.info(f"Incremental sync complete. Added {events_added}, updated {events_updated}, deleted {events_deleted} events.")
+        self._finish_pass(pass_started)
+        logger.info("Incremental sync complete. Added %s, updated %s, deleted %s events.", events_added, events_updated, events_deleted)
     
-    def run(self):
-        """Run the sync process continuously."""
+    def run(self, stop_event=None):
+        """
+        Run the sync process continuously.
+        
+        Args:
+            stop_event (threading.Event): Optional event that ends the sync loop
+                when set, instead of waiting out the rest of the sync interval.
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+        
         # Perform initial sync
         self.initial_sync()
         
         # Continuous sync loop
         try:
-            while True:
-                logger.info(f"Waiting {self.sync_interval} minutes until next sync...")
-                time.sleep(self.sync_interval * 60)
+            while not stop_event.is_set():
+                logger.info("Waiting %s minutes until next sync...", self.sync_interval)
+                if stop_event.wait(self.sync_interval * 60):
+                    break
                 self.incremental_sync()
         except KeyboardInterrupt:
             logger.info("Sync process interrupted by user. Exiting...")
 
-def main():
+PARSER = argparse.ArgumentParser(description='Sync external calendars to Google Calendar')
+PARSER.add_argument('--url', required=True, help='iCal URL to sync from')
+PARSER.add_argument('--name', required=True, help='Name for the Google Calendar')
+PARSER.add_argument('--days-back', type=int, default=30, help='Number of days in the past to sync initially')
+PARSER.add_argument('--days-forward', type=int, default=60, help='Number of days in the future to sync initially')
+PARSER.add_argument('--interval', type=int, default=5, help='Minutes between sync operations')
+
+def main(argv=None):
     """Main function to parse arguments and start the sync process."""
-    parser = argparse.ArgumentParser(description='Sync external calendars to Google Calendar')
-    parser.add_argument('--url', required=True, help='iCal URL to sync from')
-    parser.add_argument('--name', required=True, help='Name for the Google Calendar')
-    parser.add_argument('--days-back', type=int, default=30, help='Number of days in the past to sync initially')
-    parser.add_argument('--days-forward', type=int, default=60, help='Number of days in the future to sync initially')
-    parser.add_argument('--interval', type=int, default=5, help='Minutes between sync operations')
-    
-    args = parser.parse_args()
+    args = PARSER.parse_args(argv)
     
     # Create and run the sync process
     sync = CalendarSync(
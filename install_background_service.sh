@@ -16,6 +16,9 @@ PLIST_NAME="com.$USERNAME.calendarsync"
 
 echo "Installing Calendar Sync background service..."
 
+# Precompile the sync module so the service starts from cached bytecode
+"$PYTHON_PATH" -m compileall -q "$SCRIPT_DIR/calendar_sync.py"
+
 case "$(uname -s)" in
     Darwin)
         # macOS
@@ -4,43 +4,74 @@ Calendar Sync Tool - Main entry point
 This script provides multiple ways to run the calendar sync tool.
 """
 import argparse
-import importlib.util
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Get the script directory for relative paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Set up logging with a path relative to the script location
+# Paths relative to the script location, resolved once at import time
+CONFIG_FILE = os.path.join(SCRIPT_DIR, 'calendar_config.json')
+SAMPLE_CONFIG_FILE = CONFIG_FILE + '.sample'
+
+# Longest wait between retries of a failing calendar sync, in seconds
+MAX_RETRY_DELAY = 300
+
+# Set up logging with a path relative to the script location.
+# Sync threads only enqueue records; a single listener thread owns the
+# file and console handlers so workers never contend on their locks.
+# The log file is rotated at 10 MB, keeping 3 old copies.
 LOG_FILE = os.path.join(SCRIPT_DIR, "calendar_sync.log")
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = RotatingFileHandler(LOG_FILE, maxBytes=10_000_000, backupCount=3, delay=True)
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 logging.basicConfig(
-    level=logging.INFO, 
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+    level=logging.INFO,
+    format='%(message)s',
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
-# Import the CalendarSync class
-calendar_sync_path = os.path.join(SCRIPT_DIR, "calendar_sync.py")
-spec = importlib.util.spec_from_file_location("calendar_sync", calendar_sync_path)
-calendar_sync = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(calendar_sync)
+# calendar_sync is imported by run_single_sync()/run_continuous_sync() rather
+# than here: it pulls in the Google API client and icalendar, which --list and
+# --help don't need. Logging is configured by then, so its basicConfig() call
+# is a no-op.
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+# Last parsed calendar list, with the (mtime_ns, size) of the file it came from
+_config_cache = None
 
 def load_calendars():
-    """Load calendar configuration from JSON file"""
-    config_file = os.path.join(SCRIPT_DIR, 'calendar_config.json')
-    sample_config_file = os.path.join(SCRIPT_DIR, 'calendar_config.json.sample')
-    
+    """Load calendar configuration from JSON file, reusing the last parse if the file is unchanged"""
+    global _config_cache
     try:
-        with open(config_file, 'r') as f:
+        stat = os.stat(CONFIG_FILE)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if _config_cache and _config_cache[0] == file_key:
+            return _config_cache[1]
+        
+        with open(CONFIG_FILE, 'r') as f:
             config = json.load(f)
-            return config.get('calendars', [])
+        calendars = config.get('calendars', [])
+        _config_cache = (file_key, calendars)
+        return calendars
     except FileNotFoundError:
-        logger.error(f"Calendar configuration file '{config_file}' not found. Please create it first.")
+        logger.error("Calendar configuration file '%s' not found. Please create it first.", CONFIG_FILE)
         # Create a sample config file to help users get started
         sample_config = {
             "calendars": [
@@ -54,113 +85,141 @@ def load_calendars():
             ]
         }
         try:
-            with open(sample_config_file, 'w') as f:
+            with open(SAMPLE_CONFIG_FILE, 'w') as f:
                 json.dump(sample_config, f, indent=4)
-            logger.info(f"Created sample configuration file '{sample_config_file}'. "
-                        f"Rename it to 'calendar_config.json' and update with your calendar details.")
+            logger.info("Created sample configuration file '%s'. "
+                        "Rename it to 'calendar_config.json' and update with your calendar details.",
+                        SAMPLE_CONFIG_FILE)
         except Exception as write_error:
-            logger.error(f"Failed to create sample config file: {write_error}")
+            logger.error("Failed to create sample config file: %s", write_error)
         return []
     except Exception as e:
-        logger.error(f"Failed to load calendar config from {config_file}: {e}")
+        logger.error("Failed to load calendar config from %s: %s", CONFIG_FILE, e)
         return []
 
-def sync_calendar(calendar_config):
-    """Function to sync a single calendar in a separate thread"""
-    logger.info(f"Starting sync for calendar: {calendar_config['calendarName']}")
-    try:
-        sync = calendar_sync.CalendarSync(
-            ical_url=calendar_config['url'],
-            calendar_name=calendar_config['calendarName'],
-            days_back=calendar_config.get('daysBack', 30),
-            days_forward=calendar_config.get('daysForward', 60),
-            sync_interval=calendar_config.get('syncInterval', 5)
-        )
-        sync.run()
-    except Exception as e:
-        logger.error(f"Error in calendar sync for {calendar_config['calendarName']}: {e}")
+def index_calendars(calendars):
+    """Map calendar names to their configuration for --calendar lookups, warning about duplicate names"""
+    calendars_by_name = {}
+    for calendar in calendars:
+        name = calendar['calendarName']
+        if name in calendars_by_name:
+            logger.warning("Duplicate calendar name '%s' in configuration; --calendar selects the first entry", name)
+            continue
+        calendars_by_name[name] = calendar
+    return calendars_by_name
 
-def run_single_sync(calendars, calendar_name=None):
-    """Run a single sync cycle for all calendars or a specific one"""
-    if calendar_name:
-        # Sync only the specified calendar
-        target_calendar = next((cal for cal in calendars if cal['calendarName'] == calendar_name), None)
-        if not target_calendar:
-            logger.error(f"Calendar '{calendar_name}' not found in configuration")
-            return
-            
-        calendars_to_sync = [target_calendar]
-    else:
-        # Sync all calendars
-        calendars_to_sync = calendars
+@functools.lru_cache(maxsize=16)
+def _make_sync(url, calendar_name, days_back, days_forward, sync_interval):
+    """Create a CalendarSync, reusing the authenticated instance for repeated settings"""
+    return calendar_sync.CalendarSync(
+        ical_url=url,
+        calendar_name=calendar_name,
+        days_back=days_back,
+        days_forward=days_forward,
+        sync_interval=sync_interval
+    )
+
+def create_sync(calendar_config):
+    """Get a CalendarSync for a calendar configuration entry"""
+    return _make_sync(
+        calendar_config['url'],
+        calendar_config['calendarName'],
+        calendar_config.get('daysBack', 30),
+        calendar_config.get('daysForward', 60),
+        calendar_config.get('syncInterval', 5)
+    )
+
+def sync_calendar(calendar_config, stop_event=None, start_delay=0):
+    """
+    Function to sync a single calendar in a separate thread.
     
-    for calendar in calendars_to_sync:
+    Waits start_delay seconds, then keeps the sync running until stop_event is
+    set, retrying failures with exponential backoff (capped at MAX_RETRY_DELAY).
+    The backoff starts over once a sync has run for longer than MAX_RETRY_DELAY
+    before failing, so isolated errors far apart don't keep escalating it.
+    """
+    if stop_event is None:
+        stop_event = threading.Event()
+    if stop_event.wait(start_delay):
+        return
+    
+    attempt = 0
+    while not stop_event.is_set():
+        logger.info("Starting sync for calendar: %s", calendar_config['calendarName'])
+        started = time.monotonic()
         try:
-            logger.info(f"Starting single sync for calendar: {calendar['calendarName']}")
             sync = calendar_sync.CalendarSync(
-                ical_url=calendar['url'],
-                calendar_name=calendar['calendarName'],
-                days_back=calendar.get('daysBack', 30),
-                days_forward=calendar.get('daysForward', 60),
-                sync_interval=calendar.get('syncInterval', 5)
+                ical_url=calendar_config['url'],
+                calendar_name=calendar_config['calendarName'],
+                days_back=calendar_config.get('daysBack', 30),
+                days_forward=calendar_config.get('daysForward', 60),
+                sync_interval=calendar_config.get('syncInterval', 5)
             )
+            sync.run(stop_event)
+        except Exception as e:
+            if time.monotonic() - started > MAX_RETRY_DELAY:
+                attempt = 0
+            attempt += 1
+            delay = min(2 ** attempt, MAX_RETRY_DELAY)
+            logger.error("Error in calendar sync for %s: %s. Retrying in %s seconds...",
+                         calendar_config['calendarName'], e, delay)
+            stop_event.wait(delay)
+
+def run_single_sync(calendars_to_sync):
+    """Run a single sync cycle for the given calendars"""
+    # Imported outside the per-calendar error handling so a missing dependency fails fast
+    global calendar_sync
+    import calendar_sync
+    
+    for calendar in calendars_to_sync:
+        try:
+            logger.info("Starting single sync for calendar: %s", calendar['calendarName'])
+            sync = create_sync(calendar)
             # Just do an initial sync and exit
             sync.initial_sync()
-            logger.info(f"Completed single sync for calendar: {calendar['calendarName']}")
+            logger.info("Completed single sync for calendar: %s", calendar['calendarName'])
         except Exception as e:
-            logger.error(f"Error in single sync for {calendar['calendarName']}: {e}")
+            logger.error("Error in single sync for %s: %s", calendar['calendarName'], e)
 
-def run_continuous_sync(calendars, calendar_name=None):
-    """Run continuous sync for all calendars or a specific one"""
-    if calendar_name:
-        # Sync only the specified calendar
-        target_calendar = next((cal for cal in calendars if cal['calendarName'] == calendar_name), None)
-        if not target_calendar:
-            logger.error(f"Calendar '{calendar_name}' not found in configuration")
-            return
-            
-        calendars_to_sync = [target_calendar]
-    else:
-        # Sync all calendars
-        calendars_to_sync = calendars
+def run_continuous_sync(calendars_to_sync):
+    """Run continuous sync for the given calendars"""
+    # Imported before any worker starts so a missing dependency fails fast
+    # instead of being retried with backoff forever
+    global calendar_sync
+    import calendar_sync
     
-    threads = []
-    # Add a slight delay between starting threads to avoid API rate limits
-    for calendar in calendars_to_sync:
-        thread = threading.Thread(target=sync_calendar, args=(calendar,))
+    # Set on shutdown so every sync loop exits instead of finishing its sleep
+    stop_event = threading.Event()
+    
+    # One daemon thread per calendar for the life of the process; each sync
+    # retries its own failures, so no supervisor is needed.
+    # Stagger calendar starts 5 seconds apart to avoid hitting API rate limits.
+    # Each sync waits for its own offset, so this loop returns immediately.
+    for i, calendar in enumerate(calendars_to_sync):
+        thread = threading.Thread(target=sync_calendar, args=(calendar, stop_event, i * 5))
         thread.daemon = True
-        threads.append((thread, calendar))
         thread.start()
-        logger.info(f"Started syncing calendar: {calendar['calendarName']}")
-        # Add a delay between calendar starts to avoid hitting rate limits
-        time.sleep(5)  # 5 seconds between calendar syncs
+        logger.info("Scheduled sync for calendar: %s (starts in %ss)", calendar['calendarName'], i * 5)
     
-    # Keep the main thread running to monitor the calendar sync threads
     try:
-        while True:
-            time.sleep(60)  # Check every minute
-            # Check if all threads are still alive
-            for i, (thread, calendar) in enumerate(threads):
-                if not thread.is_alive():
-                    logger.warning(f"Calendar sync for {calendar['calendarName']} stopped. Restarting...")
-                    # Restart the thread
-                    new_thread = threading.Thread(target=sync_calendar, args=(calendar,))
-                    new_thread.daemon = True
-                    new_thread.start()
-                    threads[i] = (new_thread, calendar)
-                    # Wait a bit before checking the next thread to avoid rate limits
-                    time.sleep(2)
+        # Keep the main thread alive until interrupted
+        stop_event.wait()
     except KeyboardInterrupt:
         logger.info("Stopping calendar syncs...")
+        # Idle syncs return as soon as the event is set. The threads are not
+        # joined: a sync in the middle of a pass (or of a first-run browser
+        # OAuth flow) must not hold up exit, and as daemons they end with it.
+        stop_event.set()
 
-def main():
+# Command-line interface, built once at import time
+PARSER = argparse.ArgumentParser(description='Calendar Sync Tool')
+PARSER.add_argument('--single', action='store_true', help='Run a single sync and exit')
+PARSER.add_argument('--calendar', type=str, help='Sync only the specified calendar')
+PARSER.add_argument('--list', action='store_true', help='List available calendars')
+
+def main(argv=None):
     """Main function to parse arguments and start the appropriate sync mode"""
-    parser = argparse.ArgumentParser(description='Calendar Sync Tool')
-    parser.add_argument('--single', action='store_true', help='Run a single sync and exit')
-    parser.add_argument('--calendar', type=str, help='Sync only the specified calendar')
-    parser.add_argument('--list', action='store_true', help='List available calendars')
-    
-    args = parser.parse_args()
+    args = PARSER.parse_args(argv)
     
     # Load calendar configuration
     calendars = load_calendars()
@@ -176,12 +235,25 @@ def main():
             print(f"  - {cal['calendarName']}")
         return
     
+    if args.calendar:
+        # Sync only the specified calendar
+        calendars_by_name = index_calendars(calendars)
+        target_calendar = calendars_by_name.get(args.calendar)
+        if not target_calendar:
+            logger.error("Calendar '%s' not found in configuration", args.calendar)
+            logger.info("Available calendars: %s", ', '.join(calendars_by_name))
+            return
+        calendars_to_sync = [target_calendar]
+    else:
+        # Sync all calendars; several feeds may share one Google calendar name
+        calendars_to_sync = calendars
+    
     # Run in single sync mode if requested
     if args.single:
-        run_single_sync(calendars, args.calendar)
+        run_single_sync(calendars_to_sync)
     else:
         # Run in continuous mode
-        run_continuous_sync(calendars, args.calendar)
+        run_continuous_sync(calendars_to_sync)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file